@@ -12,6 +12,7 @@ UI:
 
 API:
   GET  /status
+  GET  /events                  -> server-sent events stream of /status
   GET  /view                    -> browser mirror of the UI
   POST /reset
   POST /pause
@@ -22,18 +23,31 @@ API:
 
 Env:
   PACE_TOTAL_SECONDS (default 7200), PACE_NUM_ENDS (default 8),
-  PACE_PORT (default 5000), PACE_LOGO_URL (optional)
+  PACE_PORT (default 5000), PACE_LOGO_URL (optional),
+  PACE_RENDER_W / PACE_RENDER_H (default 1280x720, upscaled by SDL; 0 renders at
+  native resolution, the only mode where partial dirty-rect display updates apply)
 """
 
 import os
 import io
 import time
 import threading
+import queue
 import json
+import re
+import http.client
+import tempfile
+import urllib.error
+import urllib.request
+import zlib
 from typing import Optional
 
 from flask import Flask, request, jsonify, Response, render_template, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+import orjson
 import pygame
+from waitress import serve
 
 
 # -------------------
@@ -41,7 +55,13 @@ import pygame
 # -------------------
 DEFAULT_TOTAL_SECONDS = 2 * 60 * 60  # 2 hours
 DEFAULT_NUM_ENDS = 8
+# Upper bounds for API input; keeps values JSON-serialisable (orjson is
+# limited to 64-bit ints) and the box row drawable
+MAX_TOTAL_SECONDS = 7 * 24 * 60 * 60  # 1 week
+MAX_NUM_ENDS = 50
 DEFAULT_PORT = 5000
+DEFAULT_RENDER_W = 1280
+DEFAULT_RENDER_H = 720
 CONFIG_FILE = "pace_timer_config.json"
 
 # Default configuration
@@ -76,19 +96,57 @@ def load_config():
     
     return config
 
+# Serialises POST /config's load/modify/save so concurrent updates can't lose each other
+config_write_lock = threading.Lock()
+# Process umask, read once at import (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 def save_config(config):
-    """Save configuration to file"""
+    """Save configuration to file atomically (unique temp file + rename)"""
+    tmp_path = None
     try:
-        with open(CONFIG_FILE, 'w') as f:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(CONFIG_FILE)),
+            prefix=os.path.basename(CONFIG_FILE) + ".",
+            suffix=".tmp",
+        )
+        # mkstemp creates 0600; keep the existing file's mode and owner (or
+        # the usual umask default for a new file) across the rename
+        try:
+            st = os.stat(CONFIG_FILE)
+            os.fchmod(fd, st.st_mode & 0o7777)
+            try:
+                os.fchown(fd, st.st_uid, st.st_gid)
+            except OSError:
+                pass  # only privileged processes may give files away
+        except FileNotFoundError:
+            os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, 'w') as f:
             json.dump(config, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        # Readers see either the old or the new file, never a partial write
+        os.replace(tmp_path, CONFIG_FILE)
+        tmp_path = None
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
         return False
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def config_fingerprint(logo_url, message):
+    """Cheap checksum of the display strings, used to key cached /status payloads"""
+    return zlib.crc32(f"{logo_url}\0{message}".encode("utf-8"))
 
 def reload_config():
     """Reload configuration from file and update global variables"""
-    global TOTAL_SECONDS, NUM_ENDS, LOGO_URL, MESSAGE_TEXT
+    global TOTAL_SECONDS, NUM_ENDS, LOGO_URL, MESSAGE_TEXT, CONFIG_HASH
     try:
         current_config = load_config()
         with state_lock:
@@ -96,6 +154,7 @@ def reload_config():
             NUM_ENDS = current_config["num_ends"]
             LOGO_URL = current_config["logo_url"]
             MESSAGE_TEXT = current_config["message"]
+            CONFIG_HASH = config_fingerprint(LOGO_URL, MESSAGE_TEXT)
         print(f"Configuration reloaded: {current_config}")
         return True
     except Exception as e:
@@ -107,70 +166,99 @@ config = load_config()
 TOTAL_SECONDS = config["total_seconds"]
 NUM_ENDS = config["num_ends"]
 API_PORT = int(os.environ.get("PACE_PORT", DEFAULT_PORT))
+# waitress worker threads; each open /events stream holds one for its lifetime
+API_THREADS = 16
+RENDER_W = int(os.environ.get("PACE_RENDER_W", DEFAULT_RENDER_W))
+RENDER_H = int(os.environ.get("PACE_RENDER_H", DEFAULT_RENDER_H))
 LOGO_URL = config["logo_url"]
 MESSAGE_TEXT = config["message"]
+CONFIG_HASH = config_fingerprint(LOGO_URL, MESSAGE_TEXT)
 
 
 # -------------------
 # Shared state
 # -------------------
+# state_lock serialises writers (read-modify-write of the timer, multi-field
+# config updates). Readers take no lock: each reads a single global, and the
+# timer lives in one immutable tuple that writers replace in one assignment,
+# so a reader always sees either the old or the new state, never a mix.
 state_lock = threading.Lock()
-_start_epoch = time.time()
-_manual_elapsed_offset = 0.0
-_paused = False
-_pause_epoch = None
+# (start_ns, offset_ns, pause_ns) in integer nanoseconds on the monotonic
+# clock, so wall-clock adjustments (NTP on boot) never jump the timer.
+# pause_ns is None while running.
+_timer = (time.monotonic_ns(), 0, None)
 
 
 def total_seconds() -> int:
-    with state_lock:
-        return int(TOTAL_SECONDS)
+    return int(TOTAL_SECONDS)
 
 
 def num_ends() -> int:
-    with state_lock:
-        return int(NUM_ENDS)
+    return int(NUM_ENDS)
+
+
+def _elapsed_ns(timer) -> int:
+    start_ns, offset_ns, pause_ns = timer
+    end_ns = pause_ns if pause_ns is not None else time.monotonic_ns()
+    return max(0, (end_ns - start_ns) + offset_ns)
+
+
+def timer_snapshot():
+    """(elapsed nanoseconds, paused) taken from one consistent read of the timer"""
+    timer = _timer
+    return _elapsed_ns(timer), timer[2] is not None
 
 
 def now_elapsed() -> float:
-    with state_lock:
-        if _paused:
-            return max(0.0, (_pause_epoch - _start_epoch) + _manual_elapsed_offset)
-        return max(0.0, (time.time() - _start_epoch) + _manual_elapsed_offset)
+    return _elapsed_ns(_timer) / 1e9
+
+
+def is_paused() -> bool:
+    return _timer[2] is not None
+
+
+def _set_elapsed_locked(seconds: float):
+    """set_elapsed() for callers already holding state_lock"""
+    global _timer
+    now = time.monotonic_ns()
+    # A paused timer stays paused, frozen at the new value
+    pause_ns = now if _timer[2] is not None else None
+    _timer = (now, int(seconds * 1e9), pause_ns)
 
 
 def set_elapsed(seconds: float):
-    global _start_epoch, _manual_elapsed_offset
     with state_lock:
-        _start_epoch = time.time()
-        _manual_elapsed_offset = float(seconds)
+        _set_elapsed_locked(seconds)
 
 
 def reset_timer():
-    global _start_epoch, _manual_elapsed_offset
     with state_lock:
-        _start_epoch = time.time()
-        _manual_elapsed_offset = 0.0
+        _set_elapsed_locked(0)
 
 
 def pause_timer():
-    global _paused, _pause_epoch
+    global _timer
     with state_lock:
-        if not _paused:
-            _paused = True
-            _pause_epoch = time.time()
+        start_ns, offset_ns, pause_ns = _timer
+        if pause_ns is None:
+            _timer = (start_ns, offset_ns, time.monotonic_ns())
 
 
 def resume_timer():
-    global _paused, _pause_epoch, _start_epoch
+    global _timer
     with state_lock:
-        if _paused:
-            paused_duration = time.time() - _pause_epoch
-            _start_epoch += paused_duration
-            _paused = False
-            _pause_epoch = None
+        start_ns, offset_ns, pause_ns = _timer
+        if pause_ns is not None:
+            _timer = (start_ns + time.monotonic_ns() - pause_ns, offset_ns, None)
+
+
+_HMS_RE = re.compile(r"^\s*(?:(\d+):)?(\d{1,2}):(\d{1,2})\s*$")
 
 
 def parse_hms_to_seconds(s: str) -> int:
+    m = _HMS_RE.match(s)
+    if m:
+        return int(m.group(1) or 0) * 3600 + int(m.group(2)) * 60 + int(m.group(3))
     parts = s.strip().split(":")
     if len(parts) == 1:
         return int(parts[0])
@@ -195,28 +283,123 @@ def format_seconds_clock(seconds: int) -> str:
 # -------------------
 # Flask API
 # -------------------
-app = Flask(__name__, template_folder='templates', static_folder='static')
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; used by jsonify() and request.get_json()"""
 
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
 
-@app.get("/status")
-def status():
-    el = int(now_elapsed())
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Flask(__name__, template_folder='templates', static_folder='static')
+app.json = ORJSONProvider(app)
+app.config["COMPRESS_MIN_SIZE"] = 256
+Compress(app)
+
+# Serialized /status body, reused while the visible state is unchanged
+STATUS_CACHE_TTL = 0.2
+_status_cache = {"key": None, "bytes": b"", "t": 0.0}
+
+
+def _status_response(body: Optional[bytes], etag: str) -> Response:
+    """/status response carrying a weak ETag; body None means 304 Not Modified"""
+    if body is None:
+        resp = Response(status=304)
+    else:
+        resp = Response(body, mimetype="application/json")
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+
+def _status_fields():
+    """Snapshot the /status inputs; returns (cache key, logo url, message)"""
+    elapsed_ns, paused = timer_snapshot()
+    el = elapsed_ns // 1_000_000_000
     tot = total_seconds()
-    rem = max(0, tot - el)
+    n = num_ends()
+    # The display strings and their checksum must come from the same config
     with state_lock:
-        paused = _paused
         logo = LOGO_URL
-    return jsonify(
+        message = MESSAGE_TEXT
+        cfg_hash = CONFIG_HASH
+    return (el, tot, n, paused, cfg_hash), logo, message
+
+
+def _status_body(key, logo, message) -> bytes:
+    """Serialized /status payload for key, reused from the cache when still fresh"""
+    global _status_cache
+    now = time.monotonic()
+    cached = _status_cache
+    if key == cached["key"] and now - cached["t"] < STATUS_CACHE_TTL:
+        return cached["bytes"]
+
+    el, tot, n, paused, _ = key
+    body = orjson.dumps(
         {
             "elapsed_seconds": el,
-            "remaining_seconds": rem,
+            "remaining_seconds": max(0, tot - el),
             "total_seconds": tot,
-            "num_ends": num_ends(),
+            "num_ends": n,
             "paused": paused,
             "logo_url": logo,
-            "message": MESSAGE_TEXT,
+            "message": message,
         }
     )
+    # Swap in a fresh dict so concurrent readers never see a half-updated entry
+    _status_cache = {"key": key, "bytes": body, "t": now}
+    return body
+
+
+@app.get("/status")
+def status():
+    key, logo, message = _status_fields()
+    el, tot, n, paused, cfg_hash = key
+    etag = f"{el}-{tot}-{n}-{int(paused)}-{cfg_hash:x}"
+    if request.if_none_match.contains_weak(etag):
+        return _status_response(None, etag)
+    return _status_response(_status_body(key, logo, message), etag)
+
+
+SSE_POLL_INTERVAL = 0.25
+# Also bounds how long a disconnected client's thread lingers while paused,
+# since the disconnect is only noticed on the next write
+SSE_KEEPALIVE_SECONDS = 5
+# Streams are capped well below the pool so they can never starve /status,
+# the control endpoints or static files; extra viewers get 503 and poll
+MAX_SSE_STREAMS = API_THREADS - 4
+_sse_slots = threading.BoundedSemaphore(MAX_SSE_STREAMS)
+
+
+@app.get("/events")
+def events():
+    """Server-sent events stream of the /status payload, pushed when it changes"""
+    if not _sse_slots.acquire(blocking=False):
+        return Response("Too many event streams", status=503, mimetype="text/plain")
+
+    def event_stream():
+        last_key = None
+        last_sent = 0.0
+        while True:
+            key, logo, message = _status_fields()
+            now = time.monotonic()
+            if key != last_key:
+                yield b"data: " + _status_body(key, logo, message) + b"\n\n"
+                last_key = key
+                last_sent = now
+            elif now - last_sent >= SSE_KEEPALIVE_SECONDS:
+                # Comment line keeps idle (paused) connections from timing out
+                yield b": keepalive\n\n"
+                last_sent = now
+            time.sleep(SSE_POLL_INTERVAL)
+
+    resp = Response(event_stream(), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    # The server closes the response even if the stream never started
+    resp.call_on_close(_sse_slots.release)
+    return resp
 
 
 @app.post("/reset")
@@ -237,21 +420,28 @@ def resume():
     return jsonify({"ok": True, "message": "timer resumed"})
 
 
+def duration_param() -> Optional[float]:
+    """Seconds from ?seconds=N or ?time=H:MM:SS; None if neither was given"""
+    args = request.args
+    seconds_param = args.get("seconds")
+    if seconds_param is not None:
+        return float(seconds_param)
+    time_param = args.get("time")
+    if time_param is not None:
+        return float(parse_hms_to_seconds(time_param))
+    return None
+
+
 @app.post("/set_remaining")
 def set_remaining():
     tot = total_seconds()
-    seconds_param = request.args.get("seconds")
-    time_param = request.args.get("time")
-    if seconds_param is None and time_param is None:
-        return (
-            jsonify({"ok": False, "error": "Provide seconds or time query param"}),
-            400,
-        )
     try:
-        if seconds_param is not None:
-            rem = float(seconds_param)
-        else:
-            rem = float(parse_hms_to_seconds(time_param))
+        rem = duration_param()
+        if rem is None:
+            return (
+                jsonify({"ok": False, "error": "Provide seconds or time query param"}),
+                400,
+            )
         rem = max(0.0, min(rem, float(tot)))
         elapsed_to_set = tot - rem
         set_elapsed(elapsed_to_set)
@@ -265,22 +455,19 @@ def set_remaining():
 @app.post("/set_total")
 def set_total():
     global TOTAL_SECONDS
-    seconds_param = request.args.get("seconds")
-    time_param = request.args.get("time")
-    if seconds_param is None and time_param is None:
-        return jsonify({"ok": False, "error": "Provide seconds or time query param"}), 400
     try:
-        if seconds_param is not None:
-            new_total = int(float(seconds_param))
-        else:
-            new_total = int(parse_hms_to_seconds(time_param))
+        duration = duration_param()
+        if duration is None:
+            return jsonify({"ok": False, "error": "Provide seconds or time query param"}), 400
+        new_total = int(duration)
         if new_total <= 0:
             return jsonify({"ok": False, "error": "total must be > 0"}), 400
-        el = now_elapsed()
+        if new_total > MAX_TOTAL_SECONDS:
+            return jsonify({"ok": False, "error": f"total must be <= {MAX_TOTAL_SECONDS}"}), 400
         with state_lock:
             TOTAL_SECONDS = new_total
-            if el > TOTAL_SECONDS:
-                set_elapsed(TOTAL_SECONDS)
+            if now_elapsed() > new_total:
+                _set_elapsed_locked(new_total)
         return jsonify({"ok": True, "total_seconds": total_seconds()})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 400
@@ -296,6 +483,8 @@ def set_ends():
         n = int(count)
         if n < 1:
             return jsonify({"ok": False, "error": "count must be >= 1"}), 400
+        if n > MAX_NUM_ENDS:
+            return jsonify({"ok": False, "error": f"count must be <= {MAX_NUM_ENDS}"}), 400
         with state_lock:
             NUM_ENDS = n
         return jsonify({"ok": True, "num_ends": num_ends()})
@@ -331,19 +520,20 @@ def subtract_time():
 def get_config():
     """Get current configuration settings"""
     with state_lock:
-        current_config = load_config()
         return jsonify({
-            "total_seconds": current_config["total_seconds"],
-            "num_ends": current_config["num_ends"],
-            "logo_url": current_config["logo_url"],
-            "message": current_config["message"]
+            "total_seconds": TOTAL_SECONDS,
+            "num_ends": NUM_ENDS,
+            "logo_url": LOGO_URL,
+            "message": MESSAGE_TEXT
         })
 
 @app.get("/debug")
 def debug_config():
     """Debug endpoint to check current configuration state"""
+    # Diagnostic only: the file is read here so it can be compared with the
+    # running globals, but outside the lock so it never stalls other requests
+    current_config = load_config()
     with state_lock:
-        current_config = load_config()
         return jsonify({
             "file_config": current_config,
             "global_vars": {
@@ -359,6 +549,11 @@ def debug_config():
 @app.post("/config")
 def update_config():
     """Update configuration settings"""
+    with config_write_lock:
+        return _apply_config_update()
+
+
+def _apply_config_update():
     try:
         data = request.get_json()
         if not data:
@@ -373,6 +568,8 @@ def update_config():
             new_total = int(data["total_seconds"])
             if new_total <= 0:
                 return jsonify({"ok": False, "error": "Total seconds must be > 0"}), 400
+            if new_total > MAX_TOTAL_SECONDS:
+                return jsonify({"ok": False, "error": f"Total seconds must be <= {MAX_TOTAL_SECONDS}"}), 400
             current_config["total_seconds"] = new_total
             updated = True
         
@@ -381,6 +578,8 @@ def update_config():
             new_ends = int(data["num_ends"])
             if new_ends < 1:
                 return jsonify({"ok": False, "error": "Number of ends must be >= 1"}), 400
+            if new_ends > MAX_NUM_ENDS:
+                return jsonify({"ok": False, "error": f"Number of ends must be <= {MAX_NUM_ENDS}"}), 400
             current_config["num_ends"] = new_ends
             updated = True
         
@@ -414,7 +613,7 @@ def update_config():
 @app.get("/view")
 def view():
     """
-    Template-based HTML mirror. JS pulls /status and injects the logo, timer, boxes, fills, and pointer.
+    Template-based HTML mirror. JS streams /events (or polls /status) and injects the logo, timer, boxes, fills, and pointer.
     """
     return render_template('view.html')
 
@@ -435,59 +634,144 @@ def static_files(filename):
 
 def run_api():
     time.sleep(1)
-    app.run(host="0.0.0.0", port=API_PORT, debug=False, threaded=True)
+    # waitress serves from a thread pool inside this process, so the API
+    # shares timer state with the pygame UI running on the main thread
+    serve(app, host="0.0.0.0", port=API_PORT, threads=API_THREADS)
 
 
 # -------------------
 # Pygame UI
 # -------------------
-def try_load_logo_from_url(url: str, max_h: int) -> Optional[pygame.Surface]:
-    if not url:
-        return None
-    try:
-        import urllib.request
-        with urllib.request.urlopen(url, timeout=5) as resp:
-            data = resp.read()
-        raw = io.BytesIO(data)
-        img = pygame.image.load(raw).convert_alpha()
-        w, h = img.get_size()
-        if h > max_h:
-            scale = max_h / float(h)
-            img = pygame.transform.smoothscale(img, (int(w * scale), int(h * scale)))
-        return img
-    except Exception as e:
-        print("[logo] load failed:", e)
-        return None
+def _convert_for_blit(img: pygame.Surface) -> pygame.Surface:
+    """Convert to display format, keeping per-pixel alpha only if the image uses it."""
+    if not (img.get_flags() & pygame.SRCALPHA) and img.get_colorkey() is None:
+        return img.convert()
+    img = img.convert_alpha()
+    w, h = img.get_size()
+    # Mask bits are set where alpha > 254, i.e. fully opaque pixels
+    if pygame.mask.from_surface(img, 254).count() == w * h:
+        return img.convert()
+    return img
+
+
+def load_logo_from_url(url: str, max_h: int) -> pygame.Surface:
+    """Download, decode and scale the logo; raises on any failure."""
+    with urllib.request.urlopen(url, timeout=5) as resp:
+        data = resp.read()
+    raw = io.BytesIO(data)
+    img = pygame.image.load(raw)
+    img = _convert_for_blit(img)
+    w, h = img.get_size()
+    if h > max_h:
+        scale = max_h / float(h)
+        img = pygame.transform.smoothscale(img, (int(w * scale), int(h * scale)))
+    return img
+
+
+# Logos fetched off the UI thread, handed over as (url, surface)
+_logo_queue = queue.Queue(1)
+LOGO_RETRY_MAX_DELAY = 60
+
+
+def _async_load_logo(url: str, max_h: int):
+    """Fetch the logo in the background.
+
+    Network errors (and HTTP 5xx) are retried with backoff until the logo
+    loads or LOGO_URL changes; HTTP 4xx, malformed URLs or undecodable
+    image data give up at once.
+    """
+    delay = 2
+    while url == LOGO_URL:
+        try:
+            img = load_logo_from_url(url, max_h)
+        except urllib.error.HTTPError as e:
+            if e.code < 500:
+                print("[logo] load failed, giving up:", e)
+                return
+            print("[logo] load failed, retrying:", e)
+        except (OSError, http.client.HTTPException) as e:
+            # URLError, timeouts, resets and truncated reads are all transient
+            print("[logo] load failed, retrying:", e)
+        except (pygame.error, ValueError) as e:
+            # Undecodable image data, or a malformed URL
+            print("[logo] load failed, giving up:", e)
+            return
+        else:
+            _logo_queue.put((url, img))
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, LOGO_RETRY_MAX_DELAY)
 
 
-def draw_wrapped_text(surface, font, text, color, rect, line_height=1.3):
-    """Render word-wrapped text inside rect; returns used height."""
+def render_wrapped_text(font, text, color, width, line_height=1.3):
+    """Pre-render word-wrapped text; returns ([(surface, y_offset)], used height)."""
     words = text.split()
-    y = rect.top
-    line = ""
-    used = 0
-    for w in words:
-        trial = (line + " " + w).strip()
-        if font.size(trial)[0] <= rect.width:
-            line = trial
+    if not words:
+        return [], 0
+    # Measure each word once and sum widths, rather than re-measuring the
+    # whole growing line for every word appended to it
+    space_w = font.size(" ")[0]
+    step = int(font.get_linesize() * line_height)
+    lines = []
+    y = 0
+    line = [words[0]]
+    cur_w = font.size(words[0])[0]
+    for w in words[1:]:
+        word_w = font.size(w)[0]
+        if cur_w + space_w + word_w <= width:
+            line.append(w)
+            cur_w += space_w + word_w
+        else:
+            lines.append((font.render(" ".join(line), True, color), y))
+            y += step
+            line = [w]
+            cur_w = word_w
+    lines.append((font.render(" ".join(line), True, color), y))
+    return lines, y + font.get_linesize()
+
+
+def fit_wrapped_text(text, color, width, max_height, max_size, min_size=18, line_height=1.3):
+    """Largest font size (stepping by 2) whose wrapped text fits max_height.
+
+    Returns (font, [(surface, y_offset)]). Fitting is monotonic in size, so the
+    ladder is binary searched and only O(log sizes) layouts are rendered.
+    """
+    sizes = list(range(max_size, min_size - 1, -2))
+    layouts = {}
+
+    def layout(i):
+        if i not in layouts:
+            font = pygame.font.SysFont(None, sizes[i])
+            lines, used = render_wrapped_text(font, text, color, width, line_height)
+            layouts[i] = (font, lines, used)
+        return layouts[i]
+
+    # Find the first (largest) size that fits; fall back to the smallest
+    lo, hi = 0, len(sizes) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if layout(mid)[2] <= max_height:
+            hi = mid
         else:
-            surf = font.render(line, True, color)
-            surface.blit(surf, (rect.left, y))
-            y += int(font.get_linesize() * line_height)
-            used = y - rect.top
-            line = w
-    if line:
-        surf = font.render(line, True, color)
-        surface.blit(surf, (rect.left, y))
-        used = (y - rect.top) + font.get_linesize()
-    return used
+            lo = mid + 1
+    font, lines, _ = layout(lo)
+    return font, lines
 
 
 def main():
     pygame.init()
     pygame.font.init()
 
-    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    scaled = RENDER_W > 0 and RENDER_H > 0
+    if scaled:
+        # Draw at a reduced internal resolution; SCALED lets SDL upscale it to
+        # the panel on the GPU, keeping the aspect ratio
+        screen = pygame.display.set_mode((RENDER_W, RENDER_H), pygame.FULLSCREEN | pygame.SCALED)
+    else:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    # SCALED presents through an SDL renderer, where update(rects) pushes the
+    # whole frame anyway; dirty-rect tracking only pays off at native resolution
+    partial_updates = not scaled
     pygame.display.set_caption("Pace Timer")
     clock = pygame.time.Clock()
 
@@ -514,9 +798,19 @@ def main():
     # nonlocal bindings for inner recompute function
     box_rects = []
     number_font = pygame.font.SysFont(None, 100)
+    # Pre-rendered pieces that only change with N: box outlines on one
+    # transparent layer, plus each box's number (drawn over the fill)
+    box_layer = None
+    box_layer_pos = (0, 0)
+    digit_surfs = []
+    digit_pos = []
+    # Per-box fill rects, reused each frame with only the width changed
+    fill_rects = []
+    max_fill_w = []
 
     def recompute_boxes(N: int):
-        nonlocal box_rects, number_font
+        nonlocal box_rects, number_font, box_layer, box_layer_pos, digit_surfs, digit_pos
+        nonlocal fill_rects, max_fill_w
         N = max(1, N)
         box_w = int((grid_width - (N + 1) * box_margin) / N)
         box_h = int(min(grid_h, grid_bottom - grid_top))
@@ -526,45 +820,117 @@ def main():
             x = grid_left + box_margin + i * (box_w + box_margin)
             rects.append(pygame.Rect(x, box_y, box_w, box_h))
         number_font = pygame.font.SysFont(None, max(64, int(box_h * 0.55)))
+
+        # Layer covers only the row of boxes, so the per-pixel alpha blit stays small
+        layer_rect = rects[0].unionall(rects).inflate(4, 4)
+        box_layer = pygame.Surface(layer_rect.size, pygame.SRCALPHA).convert_alpha()
+        for rect in rects:
+            pygame.draw.rect(
+                box_layer, ACCENT, rect.move(-layer_rect.left, -layer_rect.top),
+                width=3, border_radius=16,
+            )
+        box_layer_pos = layer_rect.topleft
+        digit_surfs = [number_font.render(str(i + 1), True, FG) for i in range(N)]
+        digit_pos = [
+            (r.centerx - d.get_width() // 2, r.centery - d.get_height() // 2)
+            for r, d in zip(rects, digit_surfs)
+        ]
+        fill_rects = [pygame.Rect(r.left + 3, r.top + 3, r.width - 6, r.height - 6) for r in rects]
+        max_fill_w = [r.width - 6 for r in rects]
         return rects
 
     box_rects = recompute_boxes(num_ends())
     timer_font = pygame.font.SysFont(None, max(42, int(top_area_h * 0.55)))
     msg_font_sz = max(28, int(msg_area_h * 0.34))
-    msg_font = pygame.font.SysFont(None, msg_font_sz)
+    msg_outer = pygame.Rect(
+        outer_margin, sh - msg_area_h, sw - 2 * outer_margin, msg_area_h - outer_margin
+    )
+    inner = msg_outer.inflate(-20, -20)
+    msg_text_rect = pygame.Rect(inner.left + 8, inner.top + 8, inner.width - 16, inner.height - 16)
+    # Fitted message layout, rebuilt only when the text or panel size changes
+    msg_cache = {"text": None, "size": None, "surfs": []}
     pointer_font = pygame.font.SysFont(None, max(24, int(top_area_h * 0.28)))
-    logo_surface = try_load_logo_from_url(LOGO_URL, max_h=int(top_area_h * 0.95))
+    logo_surface = None
+    logo_url = None
+
+    # With partial_updates, only regions that changed are pushed to the
+    # display; a full flip is reserved for the first frame and layout changes
+    full_redraw = True
+    prev_dirty = []
+    prev_fill_ws = []
+    # WINDOWEXPOSED only exists from pygame 2.0.1
+    expose_events = (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", pygame.VIDEOEXPOSE))
+    # Frames are skipped while nothing visible has changed
+    last_render_key = None
 
     running = True
     while running:
-        if len(box_rects) != num_ends():
-            box_rects = recompute_boxes(num_ends())
-
+        key_pressed = False
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in expose_events:
+                # Display contents were lost (VT switch, screensaver); repaint everything
+                full_redraw = True
             elif event.type == pygame.KEYDOWN:
+                key_pressed = True
                 if event.key in (pygame.K_ESCAPE, pygame.K_q):
                     running = False
                 elif event.key == pygame.K_r:
                     reset_timer()
                 elif event.key == pygame.K_SPACE:
-                    with state_lock:
-                        if _paused:
-                            resume_timer()
-                        else:
-                            pause_timer()
+                    if is_paused():
+                        resume_timer()
+                    else:
+                        pause_timer()
+        if not running:
+            break
+
+        # Start a background fetch whenever the configured logo changes
+        if LOGO_URL != logo_url:
+            logo_url = LOGO_URL
+            if logo_surface is not None:
+                logo_surface = None
+                full_redraw = True
+            if logo_url:
+                threading.Thread(
+                    target=_async_load_logo,
+                    args=(logo_url, int(top_area_h * 0.95)),
+                    daemon=True,
+                ).start()
+        try:
+            fetched_url, fetched_surface = _logo_queue.get_nowait()
+            if fetched_url == logo_url:
+                logo_surface = fetched_surface
+                full_redraw = True
+        except queue.Empty:
+            pass
+
+        if len(box_rects) != num_ends():
+            box_rects = recompute_boxes(num_ends())
+            full_redraw = True
+
+        elapsed_ns, paused = timer_snapshot()
+        el = elapsed_ns / 1e9
+        tot = float(total_seconds()) or 1.0
+        frac = max(0.0, min(1.0, el / tot))
+        N = len(box_rects)
+        # Fill progress in pixels, so the render key changes whenever a fill would grow
+        progress_px = int(frac * N * max_fill_w[0])
+        render_key = (int(el), tot, N, paused, progress_px, MESSAGE_TEXT)
+        if render_key == last_render_key and not (full_redraw or key_pressed):
+            pygame.time.wait(100)
+            continue
+        last_render_key = render_key
 
         screen.fill(BG)
 
         # Timer pill (top-right)
-        el = now_elapsed()
         elapsed_int = int(el)
-        show_seconds = min(elapsed_int, total_seconds())
+        show_seconds = min(elapsed_int, int(tot))
         timer_text = format_seconds_clock(show_seconds)
-        with state_lock:
-            if _paused:
-                timer_text += "  (paused)"
+        if paused:
+            timer_text += "  (paused)"
         t_surf = timer_font.render(timer_text, True, FG)
         pad_x, pad_y = 16, 10
         tr = t_surf.get_rect()
@@ -585,29 +951,25 @@ def main():
             screen.blit(logo_surface, lr)
 
         # Boxes row & fill
-        tot = float(total_seconds()) or 1.0
-        frac = max(0.0, min(1.0, el / tot))
-        N = len(box_rects)
         end_units = frac * N
         full_boxes = int(end_units)
         partial = end_units - full_boxes
 
-        for idx, rect in enumerate(box_rects):
-            pygame.draw.rect(screen, ACCENT, rect, width=3, border_radius=16)
+        screen.blit(box_layer, box_layer_pos)
+        fill_ws = []
+        for idx in range(N):
             if idx < full_boxes:
-                fill_w = rect.width - 6
+                fill_w = max_fill_w[idx]
             elif idx == full_boxes:
-                fill_w = int((rect.width - 6) * partial)
+                fill_w = int(max_fill_w[idx] * partial)
             else:
                 fill_w = 0
+            fill_ws.append(fill_w)
             if fill_w > 0:
-                fill_rect = pygame.Rect(rect.left + 3, rect.top + 3, fill_w, rect.height - 6)
+                fill_rect = fill_rects[idx]
+                fill_rect.width = fill_w
                 pygame.draw.rect(screen, FILL, fill_rect, border_radius=12)
-            txt = number_font.render(str(idx + 1), True, FG)
-            screen.blit(
-                txt,
-                (rect.centerx - txt.get_width() // 2, rect.centery - txt.get_height() // 2),
-            )
+            screen.blit(digit_surfs[idx], digit_pos[idx])
 
         # Pointer arrow + label above current end
         current_idx = min(N - 1, max(0, full_boxes))
@@ -634,38 +996,45 @@ def main():
         pygame.draw.rect(screen, ACCENT, bg_rect, width=2, border_radius=10)
         screen.blit(label_surf, label_bg)
 
+        if partial_updates:
+            pointer_rect = bg_rect.union(
+                pygame.Rect(cx - arrow_half, arrow_tip_y, 2 * arrow_half, arrow_height)
+            )
+            dirty = [timer_bg_rect.inflate(4, 4), pointer_rect.inflate(4, 4)]
+            if fill_ws != prev_fill_ws:
+                dirty.extend(
+                    box_rects[i] for i, w in enumerate(fill_ws)
+                    if i >= len(prev_fill_ws) or w != prev_fill_ws[i]
+                )
+            prev_fill_ws = fill_ws
+
         # Message panel (clipped, shrink-to-fit)
-        msg_outer = pygame.Rect(
-            outer_margin, sh - msg_area_h, sw - 2 * outer_margin, msg_area_h - outer_margin
-        )
-        inner = msg_outer.inflate(-20, -20)
         pygame.draw.rect(screen, PANEL_BG, msg_outer, border_radius=12)
         pygame.draw.rect(screen, ACCENT, msg_outer, width=2, border_radius=12)
 
-        prev_clip = screen.get_clip()
-        screen.set_clip(msg_outer)  # ensure nothing draws outside the panel
-
-        # Attempt shrinking until it fits
-        trial_size = msg_font_sz
-        while trial_size >= 18:
-            font = pygame.font.SysFont(None, trial_size)
-            # clear interior each pass so we don't stack lines
-            pygame.draw.rect(screen, PANEL_BG, msg_outer.inflate(-2, -2), border_radius=12)
-            used = draw_wrapped_text(
-                screen,
-                font,
-                MESSAGE_TEXT,
-                FG,
-                pygame.Rect(inner.left + 8, inner.top + 8, inner.width - 16, inner.height - 16),
-                line_height=1.28,
+        if MESSAGE_TEXT != msg_cache["text"] or msg_text_rect.size != msg_cache["size"]:
+            # Shrink to fit; only redone when the text changes
+            _, lines = fit_wrapped_text(
+                MESSAGE_TEXT, FG, msg_text_rect.width, inner.height - 12,
+                max_size=msg_font_sz, line_height=1.28,
             )
-            if used <= inner.height - 12:
-                break
-            trial_size -= 2
+            msg_cache.update(text=MESSAGE_TEXT, size=msg_text_rect.size, surfs=lines)
+            full_redraw = True
 
+        prev_clip = screen.get_clip()
+        screen.set_clip(msg_outer)  # ensure nothing draws outside the panel
+        for line_surf, dy in msg_cache["surfs"]:
+            screen.blit(line_surf, (msg_text_rect.left, msg_text_rect.top + dy))
         screen.set_clip(prev_clip)
 
-        pygame.display.flip()
+        if full_redraw or not partial_updates:
+            pygame.display.flip()
+        else:
+            # Include last frame's regions so anything that moved away is cleared
+            pygame.display.update(prev_dirty + dirty)
+        if partial_updates:
+            prev_dirty = dirty
+        full_redraw = False
         clock.tick(30)
 
     pygame.quit()
@@ -72,13 +72,13 @@ if [[ -f "requirements.txt" ]]; then
         sudo apt update
         
         # Install Python packages via apt
-        sudo apt install -y python3-pygame python3-flask python3-pip
+        sudo apt install -y python3-pygame python3-flask python3-orjson python3-waitress python3-flask-compress python3-pip
         
         echo "✓ Python dependencies installed via system packages"
     fi
 else
-    echo "Installing pygame and flask..."
-    if pip3 install pygame flask 2>/dev/null; then
+    echo "Installing pygame, flask, orjson, waitress and flask-compress..."
+    if pip3 install pygame flask orjson waitress flask-compress 2>/dev/null; then
         echo "✓ Python dependencies installed via pip"
     else
         echo "Pip installation failed, trying system packages..."
@@ -88,7 +88,7 @@ else
         sudo apt update
         
         # Install Python packages via apt
-        sudo apt install -y python3-pygame python3-flask python3-pip
+        sudo apt install -y python3-pygame python3-flask python3-orjson python3-waitress python3-flask-compress python3-pip
         
         echo "✓ Python dependencies installed via system packages"
     fi
@@ -1,5 +1,5 @@
 async function getStatus() {
-  const r = await fetch('/status', { cache: 'no-store' });
+  const r = await fetch('/status', { cache: 'no-cache' });
   return r.json();
 }
 
@@ -176,10 +176,36 @@ async function tick() {
   setTimeout(tick, 500);
 }
 
+// Receive status pushes from the server. EventSource reconnects by itself
+// after network blips or restarts; only when it gives up for good (e.g. the
+// server refused with 503 because it has too many streams) fall back to polling
+function startStream() {
+  const source = new EventSource('/events');
+  source.onmessage = (event) => {
+    try {
+      updateView(JSON.parse(event.data));
+    } catch (e) {
+      console.error('Error handling status event:', e);
+    }
+  };
+  source.onerror = () => {
+    if (source.readyState === EventSource.CLOSED) {
+      console.error('Status stream unavailable, falling back to polling');
+      tick();
+    } else {
+      console.error('Status stream interrupted, reconnecting...');
+    }
+  };
+}
+
 // Initialize the app
 window.addEventListener('resize', () => {
   getStatus().then(updateView).catch(() => {});
 });
 
-// Start the update loop
-tick();
+// Start the update loop, falling back to polling without EventSource support
+if (window.EventSource) {
+  startStream();
+} else {
+  tick();
+}